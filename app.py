@@ -9,21 +9,72 @@ This application:
 - Returns list of videos to play sequentially
 """
 
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory
 import os
+import re
 import string
 import unicodedata
 import json
+import logging
+import pickle
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+from backend.unicode_tables import combining_table
+
+# Optional: compact read-only trie storage for large video libraries
+try:
+    import marisa_trie
+except ImportError:
+    marisa_trie = None
+
+# Optional: fast C JSON encoder for API responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
+logger = logging.getLogger(__name__)
+
 # Path to the video database
 VIDEO_BASE_PATH = r"c:\Users\bouha\Downloads\vidss"
 
+# On-disk cache of the video index, reused across restarts while the video tree is unchanged
+VIDEO_INDEX_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'video_index.pkl')
+
+# Format of VIDEO_INDEX_CACHE; bump whenever the cached tuple or the way keys are
+# built (normalize_text, lemmatize_word, the lemma tables) changes, so old caches are rebuilt
+VIDEO_INDEX_VERSION = 2
+
+# Browser cache lifetime for sign videos (seconds); the same clips replay across translations
+VIDEO_CACHE_MAX_AGE = 31536000
+
+# Number of threads walking top-level video subdirectories in parallel
+VIDEO_SCAN_WORKERS = 8
+
 # Global dictionary to store video mappings
 # Key: normalized word, Value: relative path to video file
+# Once loaded, replaced by a marisa_trie.BytesTrie (UTF-8 paths) when marisa-trie is installed
 video_database = {}
 
+# Set once load_video_database has finished (successfully or not); the index
+# is built on a background thread so the server can start serving immediately
+_db_ready = threading.Event()
+
+# Shortest database key accepted as a prefix match for an unknown word
+MIN_PREFIX_MATCH_LENGTH = 3
+
+# Most characters an unknown word may have beyond its prefix match (a plural
+# or a trailing typo); longer leftovers are different words ("coude" is not
+# "cou"), and a wrong sign is worse than a missing one. Even accepted prefix
+# matches are reported as approximate so the frontend can flag them.
+MAX_PREFIX_MATCH_SUFFIX = 1
+
 # French verb conjugation mapping - maps conjugated forms to base form (infinitive)
 VERB_CONJUGATIONS = {
     # Aller (to go)
@@ -70,7 +121,93 @@ FRENCH_SYNONYMS = {
     'hello': 'bonjour', 'hi': 'bonjour', 'hey': 'bonjour'
 }
 
+# Exact-match lemma lookup merged from the maps above.
+# Later entries win, so synonyms override conjugations, which override plurals.
+_LEMMA_DIRECT = {**PLURAL_TO_SINGULAR, **VERB_CONJUGATIONS, **FRENCH_SYNONYMS}
+
+# Plural suffix rules, tried in order:
+# 1. -aux → -al when at least two characters precede it (chevaux → cheval)
+# 2. -s → drop, unless the word has fewer than 3 letters or ends in -ss (classe stays)
+# 3. -x → drop when at least two characters precede it
+_SUFFIX_RE = re.compile(r'(.{2,})aux|(.+[^s])s|(..+)x', re.DOTALL)
+
+# Translation table replacing punctuation with spaces (built once, reused by normalize_text)
+_PUNCT_TO_SPACE = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+
+def _build_fold_table():
+    """
+    Build a translation table that lowercases, strips accents and replaces
+    punctuation with spaces in a single str.translate pass.
+    
+    Covers ASCII and the Latin-1/Latin Extended letters used in French; each
+    accented letter maps to exactly what lowercasing + NFD + mark removal
+    would produce (É → e, ç → c). Characters outside the table are left for
+    the full Unicode path.
+    """
+    fold_table = dict(zip(string.ascii_uppercase, string.ascii_lowercase))
+    fold_table.update(dict.fromkeys(string.punctuation, ' '))
+    
+    # Only this block is classified here; the full Mn table is built lazily
+    # for the exotic-input path
+    for codepoint in range(0xC0, 0x250):
+        decomposed = unicodedata.normalize('NFD', chr(codepoint).lower())
+        folded = ''.join(char for char in decomposed if unicodedata.category(char) != 'Mn')
+        if len(folded) == 1 and folded.isascii():
+            fold_table[chr(codepoint)] = folded.translate(_PUNCT_TO_SPACE)
+    
+    return str.maketrans(fold_table)
+
+
+# Lowercase + accent + punctuation folding table for the common (French) case
+_FOLD_TABLE = _build_fold_table()
+
+
+class Trie:
+    """
+    Character trie over normalized database keys.
+    
+    Nodes are plain dicts keyed by character; a node that terminates a key
+    stores that key under the _END sentinel. Used to find the longest known
+    key that prefixes an unknown word (e.g. "medecinx" → "medecin").
+    """
+    
+    _END = object()
+    
+    def __init__(self):
+        self.root = {}
+    
+    def insert(self, key):
+        """Add a key to the trie"""
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        node[self._END] = key
+    
+    def longest_prefix(self, word):
+        """
+        Find the longest inserted key that is a prefix of word.
+        
+        Args:
+            word (str): Word to look up
+        
+        Returns:
+            str or None: Longest matching key, or None if no key prefixes word
+        """
+        node = self.root
+        best = node.get(self._END)
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                break
+            best = node.get(self._END, best)
+        return best
+
+
+# Prefix trie over the keys of video_database, filled by load_video_database
+video_trie = Trie()
 
+
+@lru_cache(maxsize=200_000)
 def lemmatize_word(word):
     """
     Reduce a word to its base form (lemmatization).
@@ -82,47 +219,60 @@ def lemmatize_word(word):
     Returns:
         str: Base form of the word
     """
-    # Check French synonyms first (e.g., salut → bonjour)
-    if word in FRENCH_SYNONYMS:
-        return FRENCH_SYNONYMS[word]
+    # Check synonyms, verb conjugations and irregular plurals (exact match)
+    lemma = _LEMMA_DIRECT.get(word)
+    if lemma is not None:
+        return lemma
+    
+    # Check common plural patterns (-aux, -s, -x)
+    match = _SUFFIX_RE.fullmatch(word)
+    if match is None:
+        # Return as-is if no transformation found
+        return word
     
-    # Check verb conjugations (exact match)
-    if word in VERB_CONJUGATIONS:
-        return VERB_CONJUGATIONS[word]
+    al_stem, s_stem, x_stem = match.groups()
+    if al_stem is not None:
+        return al_stem + 'al'
+    return s_stem or x_stem
+
+
+def _normalize_tokens(text):
+    """
+    Normalize text into its lemmatized words by:
+    - Converting to lowercase
+    - Removing accents
+    - Removing punctuation
+    - Lemmatizing each word
     
-    # Check plural to singular (exact match)
-    if word in PLURAL_TO_SINGULAR:
-        return PLURAL_TO_SINGULAR[word]
+    Only the per-word lemmatization is memoized (words recur constantly,
+    whole request texts rarely do and have no size limit); the folding
+    itself is a single C-level str.translate pass.
     
-    # Check common plural patterns
-    # -aux → -al (chevaux → cheval, hôpitaux → hopital)
-    if word.endswith('aux') and len(word) > 4:
-        return word[:-3] + 'al'
+    Args:
+        text (str): Input text to normalize
     
-    # -s plural (most common) - but avoid removing 's' from words that naturally end in 's'
-    if word.endswith('s') and len(word) > 2:
-        singular = word[:-1]
-        # Don't remove 's' from words that end in 'ss' or single letter + s
-        if not singular.endswith('s') and len(singular) > 1:
-            return singular
+    Returns:
+        tuple: Normalized words, in order
+    """
+    # Lowercase, remove common accents and replace punctuation with spaces in one pass
+    folded = text.translate(_FOLD_TABLE)
     
-    # -x plural (e.g., yeux, but some are special cases already handled)
-    if word.endswith('x') and len(word) > 2:
-        singular = word[:-1]
-        if len(singular) > 1:
-            return singular
+    if folded.isascii():
+        text = folded
+    else:
+        # Exotic input: convert to lowercase, normalize to NFD (decomposed form) and
+        # drop combining characters, then replace punctuation with spaces
+        text = unicodedata.normalize('NFD', text.lower()).translate(combining_table())
+        text = text.translate(_PUNCT_TO_SPACE)
     
-    # Return as-is if no transformation found
-    return word
+    # Split into words and lemmatize each one
+    return tuple(map(lemmatize_word, text.split()))
 
 
 def normalize_text(text):
     """
-    Normalize text by:
-    - Converting to lowercase
-    - Removing accents
-    - Removing punctuation
-    - Lemmatizing each word
+    Normalize text to a single space-separated string of lemmatized words.
+    See _normalize_tokens for the transformations applied.
     
     Args:
         text (str): Input text to normalize
@@ -130,70 +280,310 @@ def normalize_text(text):
     Returns:
         str: Normalized text
     """
-    # Convert to lowercase
-    text = text.lower()
+    return ' '.join(_normalize_tokens(text))
+
+
+def get_video_tree_mtime():
+    """
+    Get the latest modification time of the video directory tree.
     
-    # Remove accents - normalize to NFD (decomposed form) and filter out combining characters
-    text = ''.join(
-        char for char in unicodedata.normalize('NFD', text)
-        if unicodedata.category(char) != 'Mn'
-    )
+    Adding, removing or renaming a file updates its parent directory's mtime,
+    so probing every directory of the tree detects changes to the library at
+    any depth. Every entry is still listed, but only directories are stat'ed
+    and nothing is normalized, which keeps this cheaper than a rescan. It is
+    only needed to validate an existing cache: a full scan collects the same
+    mtimes itself, so a cold start walks the tree once.
     
-    # Remove punctuation - replace with spaces to preserve word boundaries
-    text = text.translate(str.maketrans(string.punctuation, ' ' * len(string.punctuation)))
+    Returns:
+        float: Most recent directory mtime
+    """
+    max_mtime = os.stat(VIDEO_BASE_PATH).st_mtime
+    stack = [VIDEO_BASE_PATH]
     
-    # Split into words and lemmatize each one
-    words = text.split()
-    lemmatized_words = [lemmatize_word(word) for word in words if word]
+    while stack:
+        # Unreadable directories are skipped, as the scan skips them
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        max_mtime = max(max_mtime, entry.stat().st_mtime)
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+        except OSError:
+            continue
     
-    return ' '.join(lemmatized_words)
+    return max_mtime
 
 
-def load_video_database():
+def load_video_index_cache(tree_mtime):
     """
-    Scan the video directory structure and build an index of all available videos.
-    Maps normalized word names to their file paths.
+    Load video_database from VIDEO_INDEX_CACHE if it is still up to date.
     
-    The function:
-    1. Walks through all subdirectories
-    2. Finds all .mp4 files
-    3. Normalizes the filename (without extension) as the key
-    4. Stores the relative path as the value
+    Args:
+        tree_mtime (float): Current mtime of the video tree
+    
+    Returns:
+        bool: True if the cached index was loaded
     """
-    print("Loading video database...")
+    try:
+        with open(VIDEO_INDEX_CACHE, 'rb') as f:
+            version, base_path, cached_mtime, cached_database = pickle.load(f)
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        logger.warning("Ignoring unreadable video index cache: %s", e)
+        return False
     
-    if not os.path.exists(VIDEO_BASE_PATH):
-        print(f"WARNING: Video directory not found: {VIDEO_BASE_PATH}")
-        return
+    if version != VIDEO_INDEX_VERSION or base_path != VIDEO_BASE_PATH or cached_mtime < tree_mtime:
+        return False
     
-    video_count = 0
+    video_database.update(cached_database)
+    return True
+
+
+def save_video_index_cache(tree_mtime):
+    """
+    Save video_database to VIDEO_INDEX_CACHE.
+    
+    The index is written to a uniquely named temporary file and renamed over
+    the cache, so concurrent writers (e.g. the debug reloader's two processes)
+    and crashes never leave a partial file behind.
     
-    # Walk through all subdirectories
-    for root, dirs, files in os.walk(VIDEO_BASE_PATH):
-        for filename in files:
+    Args:
+        tree_mtime (float): mtime of the video tree when the scan started
+    """
+    tmp_path = f"{VIDEO_INDEX_CACHE}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((VIDEO_INDEX_VERSION, VIDEO_BASE_PATH, tree_mtime, video_database),
+                        f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, VIDEO_INDEX_CACHE)
+    except Exception as e:
+        logger.warning("Could not save video index cache: %s", e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def list_video_directory(directory, base_prefix_length):
+    """
+    List the MP4 files and subdirectories of a single directory.
+    
+    Args:
+        directory (str): Directory to list
+        base_prefix_length (int): Length of the VIDEO_BASE_PATH prefix to strip
+    
+    Returns:
+        tuple: (list of (normalized_word, relative_path) pairs, list of subdirectory paths,
+                directory mtime)
+    """
+    videos = []
+    subdirs = []
+    
+    # Stat'ed before listing, so a change made during the scan shows up as newer
+    mtime = os.stat(directory).st_mtime
+    
+    # os.scandir reports entry types without an extra stat call per file
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+            
+            filename = entry.name
+            
             # Only process MP4 files
-            if filename.lower().endswith('.mp4'):
+            if filename.lower().endswith('.mp4') and entry.is_file():
                 # Get the word from filename (remove .mp4 extension)
-                word = os.path.splitext(filename)[0]
-                
-                # Normalize the word for matching
-                normalized_word = normalize_text(word)
+                word = filename[:-4]
                 
-                # Store the relative path from VIDEO_BASE_PATH
-                relative_path = os.path.relpath(
-                    os.path.join(root, filename),
-                    VIDEO_BASE_PATH
-                )
-                
-                # Store in database (handle duplicates by keeping first occurrence)
-                if normalized_word not in video_database:
-                    video_database[normalized_word] = relative_path
-                    video_count += 1
+                # Normalize the word for matching. Curated names are usually already a
+                # single lowercase ASCII word, which only needs lemmatizing.
+                if word.isascii() and word.isalnum() and word.islower():
+                    normalized_word = lemmatize_word(word)
                 else:
-                    print(f"Duplicate word found: {normalized_word} - keeping first occurrence")
+                    normalized_word = normalize_text(word)
+                
+                # Keep the path relative to VIDEO_BASE_PATH
+                videos.append((normalized_word, entry.path[base_prefix_length:]))
     
-    print(f"Loaded {video_count} videos into database")
-    print(f"Sample entries: {list(video_database.items())[:5]}")
+    return videos, subdirs, mtime
+
+
+def scan_video_subtree(top_dir, base_prefix_length):
+    """
+    Walk a directory tree and collect its MP4 files in os.walk (top-down) order.
+    
+    Args:
+        top_dir (str): Root of the subtree to walk
+        base_prefix_length (int): Length of the VIDEO_BASE_PATH prefix to strip
+    
+    Returns:
+        tuple: (list of (normalized_word, relative_path) pairs, latest directory mtime)
+    """
+    videos = []
+    max_mtime = 0.0
+    
+    pending_dirs = [top_dir]
+    while pending_dirs:
+        # Unreadable directories are skipped, as os.walk skips them
+        try:
+            dir_videos, subdirs, mtime = list_video_directory(pending_dirs.pop(), base_prefix_length)
+        except OSError:
+            continue
+        videos.extend(dir_videos)
+        max_mtime = max(max_mtime, mtime)
+        
+        # Reversed so the first subdirectory is visited next
+        pending_dirs.extend(reversed(subdirs))
+    
+    return videos, max_mtime
+
+
+def scan_video_directory():
+    """
+    Walk the video directory and add every MP4 file to video_database.
+    
+    The function:
+    1. Walks through all subdirectories, one thread per top-level folder
+       (directory reads are I/O-bound and release the GIL)
+    2. Finds all .mp4 files
+    3. Normalizes the filename (without extension) as the key
+    4. Stores the relative path as the value
+    
+    Results are merged on the calling thread in os.walk order, so duplicates
+    resolve to the same first occurrence as a sequential walk.
+    
+    Every directory is stat'ed as it is listed, so the scan also yields the
+    tree mtime that get_video_tree_mtime would report, without a second walk.
+    
+    Returns:
+        tuple: (number of videos added, tree mtime or None if VIDEO_BASE_PATH
+                could not be read)
+    """
+    video_count = 0
+    
+    # Length of "VIDEO_BASE_PATH/" - slicing it off entry paths gives the relative path
+    base_prefix_length = len(os.path.join(VIDEO_BASE_PATH, ''))
+    
+    try:
+        videos, subdirs, tree_mtime = list_video_directory(VIDEO_BASE_PATH, base_prefix_length)
+    except OSError as e:
+        logger.warning("Could not read video directory %s: %s", VIDEO_BASE_PATH, e)
+        return video_count, None
+    
+    # executor.map yields subtree results in submission order
+    with ThreadPoolExecutor(max_workers=VIDEO_SCAN_WORKERS) as executor:
+        for subtree_videos, subtree_mtime in executor.map(scan_video_subtree, subdirs,
+                                                          [base_prefix_length] * len(subdirs)):
+            videos.extend(subtree_videos)
+            tree_mtime = max(tree_mtime, subtree_mtime)
+    
+    for normalized_word, relative_path in videos:
+        # Store in database (handle duplicates by keeping first occurrence)
+        if normalized_word not in video_database:
+            video_database[normalized_word] = relative_path
+            video_count += 1
+        else:
+            logger.debug("Duplicate word found: %s - keeping first occurrence", normalized_word)
+    
+    return video_count, tree_mtime
+
+
+def load_video_database():
+    """
+    Build the index of all available videos.
+    Maps normalized word names to their file paths.
+    
+    Reuses the pickled index from VIDEO_INDEX_CACHE when the video tree has
+    not changed since it was written; otherwise rescans the directory and
+    refreshes the cache. The tree is only probed when a cache file exists,
+    so a cold start walks it once. If marisa-trie is installed, the final index is
+    frozen into a BytesTrie (several times smaller than a dict, and answers
+    prefix queries itself); otherwise the prefix trie is rebuilt from it.
+    
+    Sets _db_ready when done, even on failure, so requests stop waiting.
+    """
+    global video_database
+    
+    try:
+        logger.info("Loading video database...")
+        
+        if not os.path.exists(VIDEO_BASE_PATH):
+            logger.warning("Video directory not found: %s", VIDEO_BASE_PATH)
+            return
+        
+        if os.path.exists(VIDEO_INDEX_CACHE) and load_video_index_cache(get_video_tree_mtime()):
+            logger.info("Loaded %d videos from index cache", len(video_database))
+        else:
+            video_count, tree_mtime = scan_video_directory()
+            if tree_mtime is not None:
+                save_video_index_cache(tree_mtime)
+            logger.info("Loaded %d videos into database", video_count)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sample entries: %s", list(islice(video_database.items(), 5)))
+        
+        if marisa_trie is not None:
+            video_database = marisa_trie.BytesTrie(
+                (word, path.encode('utf-8')) for word, path in video_database.items()
+            )
+        else:
+            for normalized_word in video_database:
+                video_trie.insert(normalized_word)
+        
+        # The index changed, so cached prefix lookups may be stale
+        match_word_prefix.cache_clear()
+    finally:
+        _db_ready.set()
+
+
+def get_video_path(word):
+    """
+    Look up the video for a normalized word.
+    
+    Args:
+        word (str): Normalized word
+    
+    Returns:
+        str or None: Relative path to the video file, or None if not found
+    """
+    if isinstance(video_database, dict):
+        return video_database.get(word)
+    
+    paths = video_database.get(word)
+    return paths[0].decode('utf-8') if paths else None
+
+
+@lru_cache(maxsize=200_000)
+def match_word_prefix(word):
+    """
+    Find the database key that best approximates an unknown word.
+    
+    Finds the longest key prefixing the word, so forms with a short extra
+    suffix or a trailing typo still resolve to a sign. Very short keys, and
+    keys leaving more than MAX_PREFIX_MATCH_SUFFIX characters of the word
+    unmatched, are ignored to avoid spurious matches.
+    
+    Args:
+        word (str): Normalized word missing from video_database
+    
+    Returns:
+        str or None: Matching database key, or None if there is no usable match
+    """
+    if isinstance(video_database, dict):
+        key = video_trie.longest_prefix(word)
+    else:
+        key = max(video_database.prefixes(word), key=len, default=None)
+    
+    if key is None or len(key) < MIN_PREFIX_MATCH_LENGTH:
+        return None
+    
+    # The longest prefix leaves the shortest suffix, so no shorter key can do better
+    if len(word) - len(key) > MAX_PREFIX_MATCH_SUFFIX:
+        return None
+    return key
 
 
 def text_to_videos(text):
@@ -201,40 +591,67 @@ def text_to_videos(text):
     Convert input text to a list of video paths.
     
     Process:
-    1. Normalize and clean the text
-    2. Split into individual words
-    3. Match each word to a video in the database
-    4. Return ordered list of video paths
+    1. Normalize and clean the text into individual words
+    2. Match each word to a video in the database, falling back to the
+       longest known prefix for words that have no exact entry
+    3. Return ordered list of video paths
     
     Args:
         text (str): Input text to translate
     
     Returns:
-        list: List of video file paths (relative to VIDEO_BASE_PATH)
+        tuple: (video paths relative to VIDEO_BASE_PATH, exactly matched words,
+                missing words, approximate matches as {'word', 'match'} dicts
+                for words played through a prefix match)
     """
-    # Normalize the entire text
-    normalized_text = normalize_text(text)
-    
-    # Split into words
-    words = normalized_text.split()
+    # Normalize the entire text into words
+    words = _normalize_tokens(text)
     
     # Find matching videos
     video_list = []
     matched_words = []
     missing_words = []
+    approximate_words = []
     
     for word in words:
-        if word in video_database:
-            video_list.append(video_database[word])
+        video_path = get_video_path(word)
+        
+        if video_path is not None:
+            video_list.append(video_path)
             matched_words.append(word)
+            continue
+        
+        # Kept apart from matched_words: the sign played is a guess
+        prefix_key = match_word_prefix(word)
+        if prefix_key is not None:
+            video_list.append(get_video_path(prefix_key))
+            approximate_words.append({'word': word, 'match': prefix_key})
         else:
             missing_words.append(word)
     
-    print(f"Input: {text}")
-    print(f"Matched: {matched_words}")
-    print(f"Missing: {missing_words}")
+    logger.debug("Input: %s", text)
+    logger.debug("Matched: %s", matched_words)
+    logger.debug("Approximate: %s", approximate_words)
+    logger.debug("Missing: %s", missing_words)
     
-    return video_list, matched_words, missing_words
+    return video_list, matched_words, missing_words, approximate_words
+
+
+def json_response(payload, status=200):
+    """
+    Build a JSON response, encoded with orjson when it is installed.
+    
+    Args:
+        payload (dict): Response body
+        status (int): HTTP status code
+    
+    Returns:
+        Flask response
+    """
+    if orjson is None:
+        return jsonify(payload), status
+    
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
 
 
 @app.route('/')
@@ -263,10 +680,19 @@ def serve_video(filename):
     Args:
         filename (str): Relative path to the video file
     
+    Videos are sent as conditional responses (ETag/Last-Modified and byte
+    ranges for seeking) with a long public cache lifetime, so clips that
+    replay across translations come from the browser cache.
+    
     Returns:
         Video file response
     """
-    return send_from_directory(VIDEO_BASE_PATH, filename)
+    response = send_from_directory(
+        VIDEO_BASE_PATH, filename, conditional=True, max_age=VIDEO_CACHE_MAX_AGE
+    )
+    response.cache_control.public = True
+    response.accept_ranges = 'bytes'
+    return response
 
 
 @app.route('/translate', methods=['POST'])
@@ -285,62 +711,79 @@ def translate():
             "videos": [list of video paths],
             "matched_words": [list of matched words],
             "missing_words": [list of words not found],
+            "approximate_words": [{"word": ..., "match": ...} for words
+                                  played through a prefix match],
             "message": "status message"
         }
     """
     try:
+        if not _db_ready.is_set():
+            return json_response({
+                'success': False,
+                'message': 'Base de vidéos en cours de chargement, veuillez réessayer',
+                'videos': [],
+                'matched_words': [],
+                'missing_words': [],
+                'approximate_words': []
+            }, 503)
+        
         # Get JSON data from request
         data = request.get_json()
         
         if not data or 'text' not in data:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'message': 'No text provided',
                 'videos': [],
                 'matched_words': [],
-                'missing_words': []
-            }), 400
+                'missing_words': [],
+                'approximate_words': []
+            }, 400)
         
         text = data['text'].strip()
         
         if not text:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'message': 'Empty text provided',
                 'videos': [],
                 'matched_words': [],
-                'missing_words': []
-            }), 400
+                'missing_words': [],
+                'approximate_words': []
+            }, 400)
         
         # Convert text to video list
-        videos, matched, missing = text_to_videos(text)
+        videos, matched, missing, approximate = text_to_videos(text)
         
         if not videos:
-            return jsonify({
+            return json_response({
                 'success': False,
                 'message': 'Aucun signe trouvé pour ce texte',
                 'videos': [],
                 'matched_words': matched,
-                'missing_words': missing
+                'missing_words': missing,
+                'approximate_words': approximate
             })
         
-        return jsonify({
+        return json_response({
             'success': True,
             'message': f'{len(videos)} signe(s) trouvé(s)',
             'videos': videos,
             'matched_words': matched,
-            'missing_words': missing
+            'missing_words': missing,
+            'approximate_words': approximate
         })
     
     except Exception as e:
-        print(f"Error in /translate: {str(e)}")
-        return jsonify({
+        logger.exception("Error in /translate: %s", e)
+        return json_response({
             'success': False,
             'message': f'Erreur serveur: {str(e)}',
             'videos': [],
             'matched_words': [],
-            'missing_words': []
-        }), 500
+            'missing_words': [],
+            'approximate_words': []
+        }, 500)
 
 
 @app.route('/api/stats')
@@ -351,9 +794,18 @@ def stats():
     Returns:
         JSON with database stats
     """
-    return jsonify({
+    # The index is still being filled on the loader thread; don't iterate it yet
+    if not _db_ready.is_set():
+        return json_response({
+            'loading': True,
+            'total_videos': len(video_database),
+            'sample_words': []
+        })
+    
+    return json_response({
+        'loading': False,
         'total_videos': len(video_database),
-        'sample_words': list(video_database.keys())[:20]
+        'sample_words': list(islice(video_database, 20))
     })
 
 
@@ -368,14 +820,18 @@ def avatarr_page():
 
 
 if __name__ == '__main__':
-    # Load the video database before starting the server
-    load_video_database()
+    # Log level from the environment (e.g. LOG_LEVEL=DEBUG to trace matching)
+    logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'WARNING').upper())
+    
+    # Load the video database in the background so the server is available immediately;
+    # /translate answers 503 until loading completes
+    threading.Thread(target=load_video_database, daemon=True).start()
     
     # Run the Flask development server
     print("\n" + "="*50)
     print("LST Translation Server Starting...")
     print("="*50)
-    print(f"Video database: {len(video_database)} signs loaded")
+    print("Video database: loading in background")
     print("Server running at: http://127.0.0.1:5000")
     print("Press CTRL+C to stop")
     print("="*50 + "\n")
@@ -19,12 +19,138 @@ Future Extensions:
 
 import os
 import json
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+import logging
+import mmap
+import string
+import sys
+import unicodedata
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Optional, Tuple, Iterator, Set
+from dataclasses import dataclass, fields
 from pathlib import Path
 
+# Optional: parallel Rust directory walker (releases the GIL, walks subtrees concurrently)
+try:
+    from scandir_rs import ReturnType, Walk
+except ImportError:
+    ReturnType = Walk = None
 
-@dataclass
+# Optional: streaming JSON parser for large manifests (picks its C backend when available)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: fast C JSON encoder/decoder for whole-manifest reads and writes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from .unicode_tables import combining_table
+except ImportError:  # Run as a script from backend/
+    from unicode_tables import combining_table
+
+logger = logging.getLogger(__name__)
+
+# Removes punctuation except underscores (kept for compound signs)
+_SIGN_ID_PUNCT_TABLE = str.maketrans('', '', string.punctuation.replace('_', ''))
+
+# Same punctuation as raw bytes, for the byte-level delete on ASCII filenames
+_SIGN_ID_PUNCT_BYTES = string.punctuation.replace('_', '').encode('ascii')
+
+# Animation file extensions picked up by the filesystem scan (lowercase, no dot)
+_SUPPORTED_EXTS = frozenset({'fbx', 'bvh', 'gltf'})
+
+# Number of threads walking top-level animation subdirectories in parallel
+# (fallback walker, used when scandir_rs is not installed)
+_SCAN_WORKERS = 8
+
+
+@lru_cache(maxsize=4096)
+def _normalize_sign_id(filename: str) -> str:
+    """
+    Normalize filename to sign ID (memoized, filenames repeat across scans)
+    Same normalization as sign_processor
+    """
+    # Lowercase
+    sign_id = filename.lower()
+    
+    if sign_id.isascii():
+        # Fast path (most filenames): no accents, and punctuation is removed
+        # with a byte-level delete, which skips str.translate's per-char lookups
+        sign_id = sign_id.encode('ascii').translate(None, _SIGN_ID_PUNCT_BYTES).decode('ascii')
+    else:
+        # Remove accents, then punctuation except underscores (for compound signs)
+        sign_id = unicodedata.normalize('NFD', sign_id).translate(combining_table())
+        sign_id = sign_id.translate(_SIGN_ID_PUNCT_TABLE)
+    
+    # Normalize whitespace; interned so every copy of a sign ID is one object
+    return sys.intern('_'.join(sign_id.split()))
+
+
+def _list_directory(directory: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    List one directory with os.scandir, reading names from the DirEntry objects
+    
+    Args:
+        directory: Directory to list
+    
+    Returns:
+        (dirs, files, subdirs) - entry names as os.walk reports them, plus the
+        paths of the subdirectories to descend into (symlinks are not followed)
+    """
+    dirs = []
+    files = []
+    subdirs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry.name)
+                continue
+            dirs.append(entry.name)
+            # Symlinked directories are listed but not followed, like os.walk
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+    return dirs, files, subdirs
+
+
+def _walk_subtree(top_dir: str, prefix_length: int) -> List[Tuple[str, List[str], List[str]]]:
+    """
+    Walk one subtree top-down, like os.walk
+    
+    Args:
+        top_dir: Subtree root
+        prefix_length: Length of the scan root path prefix to slice off
+    
+    Returns:
+        (relative_root, dirs, files) tuples in os.walk order
+    """
+    results = []
+    stack = [top_dir]
+    while stack:
+        root = stack.pop()
+        try:
+            dirs, files, subdirs = _list_directory(root)
+        except OSError:
+            continue
+        results.append((root[prefix_length:], dirs, files))
+        
+        # Reversed so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+    return results
+
+
+@dataclass(slots=True)
 class AnimationMetadata:
     """
     Metadata for a single animation file
@@ -52,11 +178,19 @@ class AnimationMetadata:
             self.tags = []
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization
+        
+        Shallow: list/dict fields are shared with this instance, not deep-copied
+        """
+        return {name: getattr(self, name) for name in _ANIMATION_METADATA_FIELDS}
+
 
+# Field names, resolved once for to_dict()
+_ANIMATION_METADATA_FIELDS = tuple(f.name for f in fields(AnimationMetadata))
 
-@dataclass
+
+@dataclass(slots=True)
 class AnimationSequenceItem:
     """
     Represents one animation in a playback sequence
@@ -103,11 +237,20 @@ class AnimationDatabase:
         # Skeleton compatibility registry
         self.skeleton_registry = {}
         
+        # Reverse index: skeleton → sign_ids animated on it
+        self._skeleton_index: Dict[str, Set[str]] = {}
+        
+        # Reverse index: category tag → sign_ids carrying it
+        self._category_index: Dict[str, Set[str]] = {}
+        
+        # Sorted get_categories() result, dropped whenever the category index changes
+        self._categories_sorted: Optional[Tuple[str, ...]] = None
+        
         # Statistics
         self.stats = {
             "total_animations": 0,
-            "by_format": {},
-            "by_category": {},
+            "by_format": Counter(),
+            "by_category": Counter(),
             "total_duration": 0.0
         }
     
@@ -128,35 +271,45 @@ class AnimationDatabase:
             scan_directory = self.animations_base_path
         
         if not os.path.exists(scan_directory):
-            print(f"Warning: Animation directory not found: {scan_directory}")
+            logger.warning("Animation directory not found: %s", scan_directory)
             return 0
         
         count = 0
-        supported_formats = ['.fbx', '.bvh', '.gltf']
+        added = []
+        
+        # Prefix turning paths relative to scan_directory into paths
+        # relative to animations_base_path (computed once, not per file)
+        scan_prefix = os.path.relpath(scan_directory, self.animations_base_path)
+        scan_prefix = '' if scan_prefix == os.curdir else scan_prefix + os.sep
         
         # Walk through all subdirectories
-        for root, dirs, files in os.walk(scan_directory):
+        for relative_root, dirs, files in self._walk_relative(scan_directory):
+            # Determine category from directory structure
+            if relative_root:
+                category = os.path.basename(relative_root)
+                dir_prefix = scan_prefix + relative_root + os.sep
+            else:
+                category = os.path.basename(scan_directory)
+                dir_prefix = scan_prefix
+            
             for filename in files:
-                ext = os.path.splitext(filename)[1].lower()
+                # One rpartition per file; a name made only of leading dots
+                # (e.g. ".fbx") has no extension, as with os.path.splitext
+                stem, dot, ext = filename.rpartition('.')
+                ext = ext.lower()
                 
-                if ext in supported_formats:
+                if dot and stem.lstrip('.') and ext in _SUPPORTED_EXTS:
                     # Extract sign ID from filename
-                    sign_id = self._normalize_sign_id(os.path.splitext(filename)[0])
+                    sign_id = self._normalize_sign_id(stem)
                     
                     # Get relative path
-                    file_path = os.path.relpath(
-                        os.path.join(root, filename),
-                        self.animations_base_path
-                    )
-                    
-                    # Determine category from directory structure
-                    category = os.path.basename(root)
+                    file_path = dir_prefix + filename
                     
                     # Create metadata (default values)
                     metadata = AnimationMetadata(
                         sign_id=sign_id,
                         file_path=file_path,
-                        format=ext[1:],  # Remove dot
+                        format=ext,
                         duration=2.5,    # Default duration (unknown until loaded)
                         tags=[category] if category else []
                     )
@@ -165,11 +318,62 @@ class AnimationDatabase:
                     if sign_id not in self.animations:
                         self.animations[sign_id] = metadata
                         count += 1
-                        self._update_stats(metadata)
+                        added.append(metadata)
+        
+        self._update_stats_bulk(added)
         
-        print(f"Loaded {count} animations from filesystem")
+        logger.info("Loaded %d animations from filesystem", count)
         return count
     
+    @staticmethod
+    def _walk_relative(scan_directory: str):
+        """
+        Walk a directory tree like os.walk, with roots relative to scan_directory
+        
+        Uses the parallel scandir_rs walker when installed (large or
+        network-mounted asset trees), otherwise an os.scandir walk with the
+        top-level subdirectories spread over a thread pool.
+        
+        Args:
+            scan_directory: Directory to walk (str or path-like)
+        
+        Yields:
+            (relative_root, dirs, files) tuples; relative_root is "" for scan_directory
+        """
+        # scandir_rs.Walk only accepts str; os.walk also took path-like objects
+        scan_directory = os.fspath(scan_directory)
+        
+        if Walk is not None:
+            # The default return type drops symlinks and special files; the
+            # extended one lists them separately, so sort them back the way
+            # os.walk does (symlinked directories are listed but not followed)
+            for relative_root, dirs, files, symlinks, other, _errors in Walk(
+                    scan_directory, return_type=ReturnType.Ext):
+                if symlinks:
+                    root = os.path.join(scan_directory, relative_root)
+                    for name in symlinks:
+                        if os.path.isdir(os.path.join(root, name)):
+                            dirs.append(name)
+                        else:
+                            files.append(name)
+                files.extend(other)
+                yield relative_root, dirs, files
+            return
+        
+        prefix_length = len(os.path.join(scan_directory, ''))
+        
+        try:
+            dirs, files, subdirs = _list_directory(scan_directory)
+        except OSError:
+            return
+        yield '', dirs, files
+        
+        # One thread per top-level subdirectory (directory reads are I/O-bound
+        # and release the GIL); executor.map keeps os.walk order
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            for subtree in executor.map(_walk_subtree, subdirs, [prefix_length] * len(subdirs)):
+                yield from subtree
+    
     def load_from_manifest(self, manifest_path: str = None) -> int:
         """
         Load animation metadata from JSON manifest file
@@ -196,44 +400,108 @@ class AnimationDatabase:
         if manifest_path is None:
             manifest_path = self.manifest_path
         
-        if not manifest_path or not os.path.exists(manifest_path):
-            print(f"Warning: Manifest file not found: {manifest_path}")
+        if not manifest_path:
+            logger.warning("Manifest file not found: %s", manifest_path)
             return 0
         
+        # Parsed entries are staged here and only stored once the whole file
+        # has been read, so a truncated or invalid manifest changes nothing
+        # (a repeated key keeps its last value, as with json.load)
+        loaded: Dict[str, AnimationMetadata] = {}
+        
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-            
-            animations_data = manifest.get('animations', {})
-            count = 0
-            
-            for sign_id, anim_data in animations_data.items():
-                metadata = AnimationMetadata(
+            for sign_id, anim_data, default_skeleton in self._iter_manifest_animations(manifest_path):
+                sign_id = sys.intern(sign_id)
+                
+                # Nested sections looked up once per entry
+                transitions = anim_data.get('transitions', {})
+                extra = anim_data.get('metadata', {})
+                loaded[sign_id] = AnimationMetadata(
                     sign_id=sign_id,
                     file_path=anim_data.get('file', ''),
                     format=anim_data.get('format', 'fbx'),
                     duration=anim_data.get('duration', 2.5),
                     fps=anim_data.get('fps', 30),
-                    skeleton=anim_data.get('skeleton', manifest.get('skeleton_standard', 'humanoid_mixamo')),
+                    skeleton=anim_data.get('skeleton', default_skeleton),
                     tags=anim_data.get('tags', []),
-                    transition_in=anim_data.get('transitions', {}).get('in', 0.3),
-                    transition_out=anim_data.get('transitions', {}).get('out', 0.3),
+                    transition_in=transitions.get('in', 0.3),
+                    transition_out=transitions.get('out', 0.3),
                     bone_count=anim_data.get('bone_count'),
-                    hand_shape=anim_data.get('metadata', {}).get('hand_shape'),
-                    movement_type=anim_data.get('metadata', {}).get('movement'),
-                    location=anim_data.get('metadata', {}).get('location')
+                    hand_shape=extra.get('hand_shape'),
+                    movement_type=extra.get('movement'),
+                    location=extra.get('location')
                 )
-                
-                self.animations[sign_id] = metadata
-                count += 1
-                self._update_stats(metadata)
-            
-            print(f"Loaded {count} animations from manifest")
-            return count
             
+        except FileNotFoundError:
+            # Opening directly instead of checking os.path.exists first saves a stat
+            logger.warning("Manifest file not found: %s", manifest_path)
+            return 0
+        
         except Exception as e:
-            print(f"Error loading manifest: {e}")
+            logger.error("Error loading manifest: %s", e)
             return 0
+        
+        for sign_id, metadata in loaded.items():
+            # Manifest entries replace existing ones; drop the old index mappings
+            previous = self.animations.get(sign_id)
+            if previous is not None:
+                self._skeleton_index.get(previous.skeleton, set()).discard(sign_id)
+                for tag in previous.tags:
+                    self._category_index.get(tag, set()).discard(sign_id)
+                self._categories_sorted = None
+            
+            self.animations[sign_id] = metadata
+        
+        self._update_stats_bulk(list(loaded.values()))
+        
+        logger.info("Loaded %d animations from manifest", len(loaded))
+        return len(loaded)
+    
+    @staticmethod
+    def _iter_manifest_animations(manifest_path: str) -> Iterator[Tuple[str, Dict, str]]:
+        """
+        Iterate over the animation entries of a manifest file
+        
+        The file is memory-mapped rather than read into a bytes copy. With
+        ijson installed it is streamed from the mapping, so only one entry is
+        held in memory at a time; otherwise it is parsed whole (orjson parses
+        straight from the mapped buffer).
+        
+        Args:
+            manifest_path: Path to manifest JSON file
+        
+        Yields:
+            (sign_id, anim_data, default_skeleton) tuples, where default_skeleton
+            is the manifest's "skeleton_standard"
+        """
+        if ijson is None and orjson is None:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            
+            default_skeleton = manifest.get('skeleton_standard', 'humanoid_mixamo')
+            for sign_id, anim_data in manifest.get('animations', {}).items():
+                yield sign_id, anim_data, default_skeleton
+            return
+        
+        with open(manifest_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if ijson is None:
+                # The view must be released before the mapping is closed
+                with memoryview(mm) as view:
+                    manifest = orjson.loads(view)
+                
+                default_skeleton = manifest.get('skeleton_standard', 'humanoid_mixamo')
+                for sign_id, anim_data in manifest.get('animations', {}).items():
+                    yield sign_id, anim_data, default_skeleton
+                return
+            
+            # First pass: the default skeleton (written before "animations" by save_manifest)
+            default_skeleton = next(ijson.items(mm, 'skeleton_standard'), 'humanoid_mixamo')
+            
+            # Second pass: stream the animation entries
+            mm.seek(0)
+            for sign_id, anim_data in ijson.kvitems(mm, 'animations', use_float=True):
+                yield sign_id, anim_data, default_skeleton
     
     def save_manifest(self, output_path: str = None) -> bool:
         """
@@ -249,7 +517,7 @@ class AnimationDatabase:
             output_path = self.manifest_path
         
         if not output_path:
-            print("Error: No manifest path specified")
+            logger.error("No manifest path specified")
             return False
         
         manifest = {
@@ -280,15 +548,51 @@ class AnimationDatabase:
             }
         
         try:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest, f, indent=2, ensure_ascii=False)
-            print(f"Manifest saved to {output_path}")
+            # Serialized up front so the file gets a single write
+            if orjson is not None:
+                data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+            
+            self._write_atomic(output_path, data)
+            logger.info("Manifest saved to %s", output_path)
             return True
         except Exception as e:
-            print(f"Error saving manifest: {e}")
+            logger.error("Error saving manifest: %s", e)
             return False
     
+    @staticmethod
+    def _write_atomic(output_path: str, data: bytes):
+        """
+        Write a file so that readers see either the old or the new content
+        
+        The data goes to a temporary file in the same directory, is fsynced,
+        and then renamed over output_path; a crash mid-write leaves the
+        previous manifest intact.
+        
+        Args:
+            output_path: Destination file path
+            data: Complete file content
+        """
+        destination = Path(output_path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Created with O_EXCL and mode 0o666, so the umask applies as for a
+        # plain open() (tempfile would create it 0o600); O_BINARY (Windows
+        # only) stops os.open() translating newlines in the encoded bytes
+        tmp_path = destination.with_name(f'.{destination.name}.{uuid.uuid4().hex}.tmp')
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        fd = os.open(tmp_path, flags, 0o666)
+        try:
+            with open(fd, 'wb') as tmp:
+                tmp.write(data)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_path, destination)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     def get_animation(self, sign_id: str) -> Optional[AnimationMetadata]:
         """
         Get animation metadata for a sign
@@ -319,11 +623,16 @@ class AnimationDatabase:
         sequence = []
         missing = []
         
+        # Hoist attribute lookups out of the per-sign loop
+        get_metadata = self.animations.get
+        append_item = sequence.append
+        append_missing = missing.append
+        
         for sign_id in sign_ids:
-            metadata = self.get_animation(sign_id)
+            metadata = get_metadata(sign_id)
             
             if metadata:
-                item = AnimationSequenceItem(
+                append_item(AnimationSequenceItem(
                     sign_id=sign_id,
                     animation_url=f"{base_url}/{metadata.file_path}",
                     duration=metadata.duration,
@@ -336,10 +645,9 @@ class AnimationDatabase:
                         "location": metadata.location,
                         "tags": metadata.tags
                     }
-                )
-                sequence.append(item)
+                ))
             else:
-                missing.append(sign_id)
+                append_missing(sign_id)
         
         return sequence, missing
     
@@ -372,63 +680,90 @@ class AnimationDatabase:
         
         return False
     
-    def get_categories(self) -> List[str]:
-        """Get list of all animation categories"""
-        categories = set()
-        for metadata in self.animations.values():
-            categories.update(metadata.tags)
-        return sorted(list(categories))
+    def validate_sequence_compatibility(
+        self,
+        sign_ids: List[str],
+        avatar_skeleton: str
+    ) -> List[bool]:
+        """
+        Check a whole sign sequence against an avatar skeleton
+        
+        Uses the skeleton reverse index, so each sign costs one set lookup.
+        
+        Args:
+            sign_ids: Ordered list of sign identifiers
+            avatar_skeleton: Skeleton identifier of avatar
+        
+        Returns:
+            One compatibility flag per sign ID (False for unknown signs)
+        """
+        compatible = self._skeleton_index.get(avatar_skeleton, frozenset())
+        return [sign_id in compatible for sign_id in sign_ids]
+    
+    def get_categories(self) -> Tuple[str, ...]:
+        """
+        Get all animation categories, sorted
+        
+        The tuple is cached between calls until the categories change.
+        """
+        if self._categories_sorted is None:
+            # Read from the category index instead of walking every animation's tags
+            self._categories_sorted = tuple(sorted(
+                tag for tag, sign_ids in self._category_index.items() if sign_ids
+            ))
+        return self._categories_sorted
     
     def get_statistics(self) -> Dict:
         """Get database statistics"""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats["by_format"] = dict(stats["by_format"])
+        stats["by_category"] = dict(stats["by_category"])
+        return stats
     
     def _normalize_sign_id(self, filename: str) -> str:
         """
         Normalize filename to sign ID
         Same normalization as sign_processor
         """
-        import unicodedata
-        import string
-        
-        # Lowercase
-        sign_id = filename.lower()
-        
-        # Remove accents
-        sign_id = unicodedata.normalize('NFD', sign_id)
-        sign_id = ''.join(
-            char for char in sign_id 
-            if unicodedata.category(char) != 'Mn'
-        )
-        
-        # Remove punctuation except underscores (for compound signs)
-        sign_id = sign_id.translate(
-            str.maketrans('', '', string.punctuation.replace('_', ''))
-        )
-        
-        # Normalize whitespace
-        sign_id = '_'.join(sign_id.split())
-        
-        return sign_id
+        return _normalize_sign_id(filename)
     
     def _update_stats(self, metadata: AnimationMetadata):
         """Update statistics when adding animation"""
-        self.stats["total_animations"] += 1
+        self._update_stats_bulk((metadata,))
+    
+    def _update_stats_bulk(self, metadata_list: List[AnimationMetadata]):
+        """
+        Update statistics for a batch of added animations
+        
+        Counter.update counts in C, so bulk loads pay one call per field
+        instead of a dict read/write per animation and tag.
+        """
+        self.stats["total_animations"] += len(metadata_list)
         
         # By format
-        fmt = metadata.format
-        self.stats["by_format"][fmt] = self.stats["by_format"].get(fmt, 0) + 1
+        self.stats["by_format"].update(metadata.format for metadata in metadata_list)
         
         # By category
-        for tag in metadata.tags:
-            self.stats["by_category"][tag] = self.stats["by_category"].get(tag, 0) + 1
+        self.stats["by_category"].update(
+            chain.from_iterable(metadata.tags for metadata in metadata_list)
+        )
         
         # Total duration
-        self.stats["total_duration"] += metadata.duration
+        self.stats["total_duration"] += sum(metadata.duration for metadata in metadata_list)
+        
+        # Skeleton and category reverse indexes
+        for metadata in metadata_list:
+            self._skeleton_index.setdefault(metadata.skeleton, set()).add(metadata.sign_id)
+            for tag in metadata.tags:
+                self._category_index.setdefault(tag, set()).add(metadata.sign_id)
+        
+        if metadata_list:
+            self._categories_sorted = None
 
 
 if __name__ == "__main__":
     # Example usage for testing
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     print("=== Animation Database Test ===\n")
     
@@ -17,13 +17,22 @@ Extensibility:
 - LOD (Level of Detail) configurations
 """
 
-import os
 import json
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+import logging
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, fields
+from pathlib import Path
 
+# Optional: fast C JSON encoder/decoder for config reads and writes
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class AvatarModel:
     """
     Metadata for a 3D avatar model
@@ -64,11 +73,19 @@ class AvatarModel:
             self.customization_options = {}
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization"""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization
+        
+        Shallow: list/dict fields are shared with this instance, not deep-copied
+        """
+        return {name: getattr(self, name) for name in _AVATAR_MODEL_FIELDS}
+
 
+# Field names, resolved once for to_dict()
+_AVATAR_MODEL_FIELDS = tuple(f.name for f in fields(AvatarModel))
 
-@dataclass
+
+@dataclass(slots=True)
 class RenderingConfig:
     """
     Rendering configuration for 3D scene
@@ -94,7 +111,11 @@ class RenderingConfig:
     background_color: str = "#f0f0f0"
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {name: getattr(self, name) for name in _RENDERING_CONFIG_FIELDS}
+
+
+# Field names, resolved once for to_dict()
+_RENDERING_CONFIG_FIELDS = tuple(f.name for f in fields(RenderingConfig))
 
 
 class AvatarManager:
@@ -125,6 +146,10 @@ class AvatarManager:
         # Default avatar ID
         self.default_avatar_id = "default_humanoid"
         
+        # Frontend payload caches, cleared whenever avatars or the default change
+        self._config_cache: Dict[Tuple[Optional[str], str], Dict] = {}
+        self._list_cache: Dict[str, List[Dict]] = {}
+        
         # Rendering presets
         self.rendering_presets = {
             "low": RenderingConfig(
@@ -146,6 +171,11 @@ class AvatarManager:
                 target_fps=60
             )
         }
+        
+        # Preset payloads for get_avatar_config, built once (presets are fixed after init)
+        self._rendering_preset_dicts: Dict[str, Dict] = {
+            name: preset.to_dict() for name, preset in self.rendering_presets.items()
+        }
     
     def load_avatars_from_config(self, config_path: str = None) -> int:
         """
@@ -172,13 +202,16 @@ class AvatarManager:
         if config_path is None:
             config_path = self.config_path
         
-        if not config_path or not os.path.exists(config_path):
-            print(f"Warning: Avatar config file not found: {config_path}")
+        if not config_path:
+            logger.warning("Avatar config file not found: %s", config_path)
             return 0
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            if orjson is not None:
+                config = orjson.loads(Path(config_path).read_bytes())
+            else:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
             
             avatars_data = config.get('avatars', {})
             count = 0
@@ -208,12 +241,20 @@ class AvatarManager:
             if 'default_avatar' in config:
                 self.default_avatar_id = config['default_avatar']
             
-            print(f"Loaded {count} avatars from config")
+            logger.info("Loaded %d avatars from config", count)
             return count
             
+        except FileNotFoundError:
+            # Opening directly instead of checking os.path.exists first saves a stat
+            logger.warning("Avatar config file not found: %s", config_path)
+            return 0
+        
         except Exception as e:
-            print(f"Error loading avatar config: {e}")
+            logger.error("Error loading avatar config: %s", e)
             return 0
+        
+        finally:
+            self._invalidate_caches()
     
     def save_avatars_config(self, output_path: str = None) -> bool:
         """
@@ -229,7 +270,7 @@ class AvatarManager:
             output_path = self.config_path
         
         if not output_path:
-            print("Error: No config path specified")
+            logger.error("No config path specified")
             return False
         
         config = {
@@ -257,13 +298,16 @@ class AvatarManager:
             }
         
         try:
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-            print(f"Avatar config saved to {output_path}")
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                Path(output_path).write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(config, f, indent=2, ensure_ascii=False)
+            logger.info("Avatar config saved to %s", output_path)
             return True
         except Exception as e:
-            print(f"Error saving avatar config: {e}")
+            logger.error("Error saving avatar config: %s", e)
             return False
     
     def get_avatar(self, avatar_id: str = None) -> Optional[AvatarModel]:
@@ -294,14 +338,20 @@ class AvatarManager:
             base_url: Base URL for asset paths
         
         Returns:
-            Dictionary with avatar config, or None if not found
+            Dictionary with avatar config, or None if not found.
+            The dictionary is cached and shared between calls: do not mutate it.
         """
+        cache_key = (avatar_id, base_url)
+        config = self._config_cache.get(cache_key)
+        if config is not None:
+            return config
+        
         avatar = self.get_avatar(avatar_id)
         
         if not avatar:
             return None
         
-        return {
+        config = {
             "id": avatar.id,
             "name": avatar.name,
             "model_url": f"{base_url}/{avatar.model_file}",
@@ -317,8 +367,11 @@ class AvatarManager:
                 "idle": avatar.idle_animation,
                 "transition": avatar.transition_animation
             },
-            "rendering": self.get_rendering_config(avatar.quality_preset).to_dict()
+            "rendering": self.get_rendering_config_dict(avatar.quality_preset)
         }
+        
+        self._config_cache[cache_key] = config
+        return config
     
     def list_avatars(self, base_url: str = "/assets") -> List[Dict]:
         """
@@ -328,8 +381,13 @@ class AvatarManager:
             base_url: Base URL for asset paths
         
         Returns:
-            List of avatar metadata dictionaries
+            List of avatar metadata dictionaries.
+            The list is cached and shared between calls: do not mutate it.
         """
+        avatars_list = self._list_cache.get(base_url)
+        if avatars_list is not None:
+            return avatars_list
+        
         avatars_list = []
         
         for avatar_id, avatar in self.avatars.items():
@@ -341,6 +399,7 @@ class AvatarManager:
                 "description": avatar.description
             })
         
+        self._list_cache[base_url] = avatars_list
         return avatars_list
     
     def get_rendering_config(self, preset: str = "medium") -> RenderingConfig:
@@ -355,6 +414,18 @@ class AvatarManager:
         """
         return self.rendering_presets.get(preset, self.rendering_presets["medium"])
     
+    def get_rendering_config_dict(self, preset: str = "medium") -> Dict:
+        """
+        Get the rendering configuration of a quality preset as a dictionary
+        
+        Args:
+            preset: Quality preset name (low, medium, high)
+        
+        Returns:
+            Dictionary precomputed at init, shared between calls: do not mutate it
+        """
+        return self._rendering_preset_dicts.get(preset, self._rendering_preset_dicts["medium"])
+    
     def register_avatar(self, avatar: AvatarModel):
         """
         Register a new avatar model
@@ -363,7 +434,8 @@ class AvatarManager:
             avatar: AvatarModel instance
         """
         self.avatars[avatar.id] = avatar
-        print(f"Registered avatar: {avatar.id}")
+        self._invalidate_caches()
+        logger.info("Registered avatar: %s", avatar.id)
     
     def set_default_avatar(self, avatar_id: str):
         """
@@ -374,13 +446,25 @@ class AvatarManager:
         """
         if avatar_id in self.avatars:
             self.default_avatar_id = avatar_id
-            print(f"Default avatar set to: {avatar_id}")
+            self._invalidate_caches()
+            logger.info("Default avatar set to: %s", avatar_id)
         else:
-            print(f"Error: Avatar not found: {avatar_id}")
+            logger.error("Avatar not found: %s", avatar_id)
+
+    
+    def _invalidate_caches(self):
+        """
+        Drop cached frontend payloads
+        
+        Must be called after any change to self.avatars or the default avatar
+        """
+        self._config_cache.clear()
+        self._list_cache.clear()
 
 
 if __name__ == "__main__":
     # Example usage for testing
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     print("=== Avatar Manager Test ===\n")
     
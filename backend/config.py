@@ -12,6 +12,7 @@ This module centralizes all configuration settings for:
 import os
 
 # ===== Base Paths =====
+# Plain strings, joined once at import
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Video assets (existing system)
@@ -27,6 +28,10 @@ AVATARS_PATH = os.path.join(ASSETS_BASE_PATH, "avatars")
 ANIMATIONS_PATH = os.path.join(ASSETS_BASE_PATH, "animations")
 CONFIG_PATH = os.path.join(ASSETS_BASE_PATH, "config")
 
+# Configuration files
+MANIFEST_FILE = os.path.join(ANIMATIONS_PATH, "animation_manifest.json")
+AVATARS_CONFIG_FILE = os.path.join(CONFIG_PATH, "avatars.json")
+
 # ===== Animation Settings =====
 ANIMATION_CONFIG = {
     # Supported animation formats
@@ -36,7 +41,7 @@ ANIMATION_CONFIG = {
     "format_preference": ["fbx", "gltf", "bvh"],
     
     # Animation manifest file
-    "manifest_file": os.path.join(ANIMATIONS_PATH, "animation_manifest.json"),
+    "manifest_file": MANIFEST_FILE,
     
     # Default transition settings
     "transitions": {
@@ -69,7 +74,7 @@ AVATAR_CONFIG = {
     "default_avatar": "default_humanoid",
     
     # Avatar configuration file
-    "config_file": os.path.join(CONFIG_PATH, "avatars.json"),
+    "config_file": AVATARS_CONFIG_FILE,
     
     # Skeleton standard
     "skeleton_standard": "humanoid_mixamo",  # or "humanoid_unreal", "custom"
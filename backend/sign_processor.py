@@ -16,14 +16,110 @@ Extensibility:
 - Contextual sign selection based on semantic analysis
 """
 
+import os
 import unicodedata
 import string
 import re
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Tuple, Optional
+from dataclasses import dataclass, field
 
+try:
+    from .unicode_tables import combining_table
+except ImportError:  # Run as a script from backend/
+    from unicode_tables import combining_table
 
-@dataclass
+
+# Removes all ASCII punctuation (built once instead of on every normalize_text call)
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+# Trie node key marking the end of a compound phrase (never a word: split() yields no empty strings)
+_PHRASE_END = ''
+
+# Shared read-only default for SignMatch.metadata (no empty dict per match)
+_EMPTY_METADATA = MappingProxyType({})
+
+
+@lru_cache(maxsize=None)
+def _accent_punct_table() -> Dict[int, None]:
+    """
+    Translation table deleting every nonspacing mark (category Mn) and all
+    ASCII punctuation, so the non-ASCII path strips accents and punctuation
+    after NFD in one C-level pass (built on first non-ASCII input)
+    """
+    return {**combining_table(), **_PUNCT_TABLE}
+
+
+@lru_cache(maxsize=4096)
+def _normalize_tokens(text: str, remove_accents: bool = True) -> Tuple[str, ...]:
+    """
+    Normalize text and split it into words (memoized, the same words recur
+    across requests)
+    See SignProcessor.normalize_text for the transformations
+    
+    Args:
+        text: Input text
+        remove_accents: Strip accents; when False, non-ASCII text is brought
+                        to NFKC instead so equivalent spellings compare equal
+    
+    Returns:
+        Tuple of normalized words; joined with single spaces they form the
+        normalized text
+    """
+    # Fast path: pure ASCII has no accents to strip and is already NFKC
+    if text.isascii():
+        return tuple(text.lower().translate(_PUNCT_TABLE).split())
+    
+    if remove_accents:
+        # Convert to lowercase
+        text = text.lower()
+        
+        # Remove accents - NFD normalization separates base chars from diacritics
+        # (Mn = Mark, Nonspacing) - and punctuation, in a single translate
+        text = unicodedata.normalize('NFD', text).translate(_accent_punct_table())
+    else:
+        # Keep accents: one NFKC pass (usually a no-op on NFC input) gives a
+        # canonical form; lowercase after it, as NFKC can produce capitals
+        text = unicodedata.normalize('NFKC', text).lower().translate(_PUNCT_TABLE)
+    
+    # Splitting on any whitespace also normalizes it
+    return tuple(text.split())
+
+
+def normalize_text(text: str, remove_accents: bool = True) -> str:
+    """
+    Normalize text for consistent processing
+    
+    Lowercases, removes accents and punctuation, and normalizes whitespace.
+    Module-level so callers that only need normalization (e.g. database
+    builders) do not have to create a SignProcessor.
+    
+    Args:
+        text: Input text
+        remove_accents: Strip accents (default); when False, non-ASCII text
+                        is NFKC-normalized and keeps its accents
+    
+    Returns:
+        Normalized text
+    """
+    return ' '.join(_normalize_tokens(text, remove_accents))
+
+
+def _normalize_key(word: str, remove_accents: bool = True) -> str:
+    """
+    Normalize a sign_database key
+    
+    Like normalize_text, but underscores are kept: compound sign IDs such as
+    "salle_de_attente" join their words with "_" (as in animation_db and
+    _detect_compound_signs), so each part is normalized on its own.
+    """
+    return '_'.join(
+        ' '.join(_normalize_tokens(part, remove_accents)) for part in word.split('_')
+    )
+
+
+@dataclass(slots=True)
 class SignMatch:
     """
     Represents a successful word → sign mapping
@@ -31,14 +127,12 @@ class SignMatch:
     word: str                # Original normalized word
     sign_id: str            # Sign identifier (matches animation/video filename)
     confidence: float = 1.0  # Future: confidence score for ambiguous matches
-    metadata: Dict = None    # Future: additional sign metadata
-    
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    # Future: additional sign metadata (pass a dict to set; the factory
+    # returns the shared empty mapping, so no dict is allocated per match)
+    metadata: Mapping = field(default_factory=lambda: _EMPTY_METADATA)
 
 
-@dataclass
+@dataclass(slots=True)
 class SignSequence:
     """
     Represents an ordered sequence of signs
@@ -67,17 +161,64 @@ class SignProcessor:
     - Future: LST grammar transformations
     """
     
-    def __init__(self, sign_database: Dict[str, str]):
+    def __init__(self, sign_database: Dict[str, str], remove_accents: bool = True):
         """
         Initialize the sign processor
         
         Args:
-            sign_database: Dictionary mapping normalized words to sign IDs
+            sign_database: Dictionary mapping words to sign IDs
                           e.g., {"medecin": "medecin", "coeur": "coeur"}
+                          Keys are normalized here, keeping the "_" of
+                          compound signs (first occurrence wins); use
+                          from_normalized() to skip that step.
+            remove_accents: Strip accents during normalization (see
+                            NLP_CONFIG["normalization"]["remove_accents"])
         """
-        self.sign_database = sign_database
+        self.remove_accents = remove_accents
+        
+        # Built once with normalized keys, so lookups by normalized word always hit
+        database = {}
+        for word, sign_id in sign_database.items():
+            database.setdefault(_normalize_key(word, remove_accents), sign_id)
+        self._set_database(database)
         self.compound_signs = {}  # Future: multi-word signs
+        self._compound_trie = None  # Word trie over compound_signs (see _get_compound_trie)
         self.grammar_rules = []   # Future: LST grammar transformations
+    
+    @classmethod
+    def from_normalized(
+        cls,
+        sign_database: Dict[str, str],
+        remove_accents: bool = True
+    ) -> 'SignProcessor':
+        """
+        Create a processor from a database whose keys are already normalized
+        
+        The dictionary is used as-is (not copied, keys not re-normalized),
+        e.g. the output of create_sign_database_from_files. Keys must have
+        been normalized with the same remove_accents setting.
+        
+        Args:
+            sign_database: Dictionary mapping normalized words to sign IDs
+            remove_accents: Strip accents during normalization
+        
+        Returns:
+            SignProcessor instance
+        """
+        processor = cls({}, remove_accents)
+        processor._set_database(sign_database)
+        return processor
+    
+    def _set_database(self, database: Dict[str, str]):
+        """
+        Install the word → sign_id dictionary
+        
+        sign_database is exposed as a read-only view, so the hot path can rely
+        on the dictionary not changing under it; lookups go to the dict itself.
+        """
+        self._db_dict = database
+        self._db_get = database.get
+        self.sign_database = MappingProxyType(database)
         
     def process_text(self, text: str) -> SignSequence:
         """
@@ -96,25 +237,21 @@ class SignProcessor:
         Returns:
             SignSequence object with matched signs and missing words
         """
-        # Step 1: Normalize
-        normalized = self.normalize_text(text)
-        
-        # Step 2: Tokenize
-        words = self.tokenize(normalized)
+        # Steps 1-2: Normalize and tokenize (through normalize_text and tokenize
+        # when a subclass overrides them)
+        normalized, words = self.normalize_and_tokenize(text)
         
         # Step 3: Grammar transformations (future)
         # words = self.apply_grammar_rules(words)
         
-        # Step 4: Map to signs
-        matched_signs = []
-        missing_words = []
-        
-        for word in words:
-            sign = self._map_word_to_sign(word)
-            if sign:
-                matched_signs.append(sign)
-            else:
-                missing_words.append(word)
+        # Step 4: Map to signs (exact lookups, same as _map_word_to_sign;
+        # the membership tests run inside the comprehensions, not per method call)
+        database = self._db_dict
+        matched_signs = [
+            SignMatch(word=word, sign_id=database[word], confidence=1.0)
+            for word in words if word in database
+        ]
+        missing_words = [word for word in words if word not in database]
         
         return SignSequence(
             matched_signs=matched_signs,
@@ -123,13 +260,33 @@ class SignProcessor:
             normalized_text=normalized
         )
     
+    def process_text_ids(self, text: str) -> List[str]:
+        """
+        Translate text straight to sign IDs
+        
+        Same result as process_text(text).get_sign_ids(), for callers that only
+        need the animation sequence: no SignMatch objects, missing-word list or
+        SignSequence are built.
+        
+        Args:
+            text: Input text to translate
+        
+        Returns:
+            List of sign IDs in order
+        """
+        words = self.normalize_and_tokenize(text)[1]
+        
+        database = self._db_dict
+        return [database[word] for word in words if word in database]
+    
     def normalize_text(self, text: str) -> str:
         """
         Normalize text for consistent processing
         
         Transformations:
         - Convert to lowercase
-        - Remove accents (é → e, à → a)
+        - Remove accents (é → e, à → a), or NFKC-normalize when the
+          processor keeps accents
         - Remove punctuation
         - Normalize whitespace
         
@@ -139,30 +296,38 @@ class SignProcessor:
         Returns:
             Normalized text
         """
-        # Convert to lowercase
-        text = text.lower()
+        return normalize_text(text, self.remove_accents)
+    
+    def normalize_and_tokenize(self, text: str) -> Tuple[str, List[str]]:
+        """
+        Normalize text and split it into words in a single pass
         
-        # Remove accents - NFD normalization separates base chars from diacritics
-        text = unicodedata.normalize('NFD', text)
-        text = ''.join(
-            char for char in text 
-            if unicodedata.category(char) != 'Mn'  # Mn = Mark, Nonspacing
-        )
+        Equivalent to tokenize(normalize_text(text)). Unless a subclass
+        overrides normalize_text or tokenize (then both are called), the
+        normalized text is not split a second time: the cached words go
+        straight to the same tokenize_words step.
         
-        # Remove punctuation
-        text = text.translate(str.maketrans('', '', string.punctuation))
+        Args:
+            text: Input text
         
-        # Normalize whitespace
-        text = ' '.join(text.split())
+        Returns:
+            (normalized_text, words) tuple
+        """
+        cls = type(self)
+        if (cls.normalize_text is not SignProcessor.normalize_text
+                or cls.tokenize is not SignProcessor.tokenize):
+            normalized = self.normalize_text(text)
+            return normalized, self.tokenize(normalized)
         
-        return text.strip()
+        tokens = _normalize_tokens(text, self.remove_accents)
+        return ' '.join(tokens), self.tokenize_words(list(tokens))
     
     def tokenize(self, text: str) -> List[str]:
         """
         Split text into words
         
         Current: Simple whitespace splitting
-        Future: Handle compound words, contractions
+        Future: Handle compound words, contractions (see tokenize_words)
         
         Args:
             text: Normalized text
@@ -170,8 +335,24 @@ class SignProcessor:
         Returns:
             List of words
         """
-        words = text.split()
+        return self.tokenize_words(text.split())
+    
+    def tokenize_words(self, words: List[str]) -> List[str]:
+        """
+        Token step applied to the whitespace-split words
+        
+        Shared by tokenize and process_text, so word-level processing added
+        here (or in a subclass override) applies to both.
         
+        Current: Words unchanged
+        Future: Handle compound words, contractions
+        
+        Args:
+            words: Normalized words
+        
+        Returns:
+            List of words
+        """
         # Future: detect compound signs
         # words = self._detect_compound_signs(words)
         
@@ -187,10 +368,11 @@ class SignProcessor:
         Returns:
             SignMatch if found, None otherwise
         """
-        if word in self.sign_database:
+        sign_id = self._db_get(word)  # One hash lookup instead of `in` + []
+        if sign_id is not None:
             return SignMatch(
                 word=word,
-                sign_id=self.sign_database[word],
+                sign_id=sign_id,
                 confidence=1.0
             )
         
@@ -228,7 +410,8 @@ class SignProcessor:
         - ["salle", "de", "attente"] → ["salle_de_attente"]
         - ["médecin", "généraliste"] → ["medecin_generaliste"]
         
-        FUTURE IMPLEMENTATION
+        Phrases registered with add_compound_sign are matched longest-first,
+        left to right, by walking a word-level trie (one pass over the words).
         
         Args:
             words: List of individual words
@@ -236,8 +419,53 @@ class SignProcessor:
         Returns:
             List with compound words merged
         """
-        # Placeholder for future compound sign detection
-        return words
+        trie = self._get_compound_trie()
+        if not trie:
+            return words
+        
+        merged = []
+        i = 0
+        while i < len(words):
+            # Longest registered phrase starting at words[i]
+            node = trie
+            match_end = i
+            compound = None
+            for j in range(i, len(words)):
+                node = node.get(words[j])
+                if node is None:
+                    break
+                if _PHRASE_END in node:
+                    match_end = j + 1
+                    compound = node[_PHRASE_END]
+            
+            if compound is None:
+                merged.append(words[i])
+                i += 1
+            else:
+                merged.append(compound)
+                i = match_end
+        
+        return merged
+    
+    def _get_compound_trie(self) -> Dict:
+        """
+        Word-level trie of the compound sign phrases, built on first use
+        
+        Each node maps a word to its child node; _PHRASE_END marks the end of
+        a phrase and holds the merged compound word.
+        """
+        if self._compound_trie is None:
+            trie = {}
+            for phrase in self.compound_signs:
+                phrase_words = phrase.split()
+                if not phrase_words:
+                    continue
+                node = trie
+                for word in phrase_words:
+                    node = node.setdefault(word, {})
+                node[_PHRASE_END] = '_'.join(phrase_words)
+            self._compound_trie = trie
+        return self._compound_trie
     
     def add_compound_sign(self, phrase: str, sign_id: str):
         """
@@ -251,6 +479,7 @@ class SignProcessor:
         """
         normalized_phrase = self.normalize_text(phrase)
         self.compound_signs[normalized_phrase] = sign_id
+        self._compound_trie = None  # Rebuilt on next use
     
     def add_grammar_rule(self, rule):
         """
@@ -339,24 +568,14 @@ def create_sign_database_from_files(file_list: List[str]) -> Dict[str, str]:
     Returns:
         Dictionary mapping normalized words to sign IDs
     """
-    import os
-    database = {}
-    
-    processor = SignProcessor({})  # Temporary instance for normalization
-    
-    for filename in file_list:
-        # Remove extension
-        name, ext = os.path.splitext(filename)
-        
-        # Normalize the name
-        normalized = processor.normalize_text(name)
-        
-        # Use normalized name as both key and value
-        # (sign_id same as normalized word)
-        if normalized and normalized not in database:
-            database[normalized] = normalized
-    
-    return database
+    # Normalize each name without its extension and use it as both key and
+    # value (sign_id same as normalized word); empty names are skipped and
+    # duplicates collapse to their first position
+    return {
+        normalized: normalized
+        for normalized in (normalize_text(os.path.splitext(filename)[0]) for filename in file_list)
+        if normalized
+    }
 
 
 if __name__ == "__main__":
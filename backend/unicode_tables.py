@@ -0,0 +1,33 @@
+"""
+Unicode Tables
+
+Translation tables shared by the text normalizers (app, and the backend's
+sign_processor and animation_db).
+
+Building a table means classifying every codepoint, which takes about
+100 ms, so each table is built on first use and then reused rather than
+at import time.
+"""
+
+import sys
+import unicodedata
+from functools import lru_cache
+from typing import Dict
+
+
+@lru_cache(maxsize=None)
+def combining_table() -> Dict[int, None]:
+    """
+    Translation table deleting every nonspacing mark (category Mn)
+    
+    Used after NFD normalization to strip accents in one C-level
+    str.translate pass. Shared between callers: do not mutate it.
+    
+    Returns:
+        Dictionary mapping each Mn codepoint to None
+    """
+    return {
+        codepoint: None
+        for codepoint in range(sys.maxunicode + 1)
+        if unicodedata.category(chr(codepoint)) == 'Mn'
+    }
@@ -0,0 +1,134 @@
+"""
+Tests for backend.animation_db
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import animation_db
+from backend.animation_db import AnimationDatabase
+
+
+class LoadFromFilesystemTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = Path(self._tmp.name)
+        for relative in ("medical/medecin.fbx", "anatomy/coeur.bvh", "anatomy/notes.txt"):
+            path = self.base / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_accepts_path_objects(self):
+        db = AnimationDatabase(self.base)
+        
+        self.assertEqual(db.load_from_filesystem(), 2)
+        self.assertEqual(db.get_animation("medecin").file_path, os.path.join("medical", "medecin.fbx"))
+        self.assertEqual(db.load_from_filesystem(self.base / "anatomy"), 0)  # Already loaded
+    
+    def test_categories_cannot_be_changed_by_callers(self):
+        db = AnimationDatabase(str(self.base))
+        db.load_from_filesystem()
+        
+        categories = db.get_categories()
+        self.assertEqual(categories, ("anatomy", "medical"))
+        with self.assertRaises(AttributeError):
+            categories.append("bogus")
+        self.assertEqual(db.get_categories(), ("anatomy", "medical"))
+    
+    def _check_walk_matches_os_walk(self):
+        expected = {
+            ('' if root == str(self.base) else os.path.relpath(root, self.base)): (sorted(dirs), sorted(files))
+            for root, dirs, files in os.walk(self.base)
+        }
+        walked = {
+            relative_root: (sorted(dirs), sorted(files))
+            for relative_root, dirs, files in AnimationDatabase._walk_relative(self.base)
+        }
+        self.assertEqual(walked, expected)
+        
+        db = AnimationDatabase(self.base)
+        db.load_from_filesystem()
+        self.assertEqual(sorted(db.animations), ["coeur", "medecin", "poumon"])
+        self.assertEqual(db.get_animation("poumon").file_path, os.path.join("medical", "poumon.fbx"))
+    
+    @unittest.skipUnless(hasattr(os, 'symlink'), "needs symlinks")
+    def test_symlinks_are_walked_like_os_walk(self):
+        # A symlinked file is loaded; a symlinked directory is listed but not followed
+        os.symlink("medecin.fbx", self.base / "medical" / "poumon.fbx")
+        os.symlink(self.base / "anatomy", self.base / "medical" / "linked")
+        
+        if animation_db.Walk is not None:
+            self._check_walk_matches_os_walk()
+        
+        saved = animation_db.Walk
+        animation_db.Walk = None
+        try:
+            self._check_walk_matches_os_walk()
+        finally:
+            animation_db.Walk = saved
+
+
+class LoadFromManifestTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self._tmp.name, "animation_manifest.json")
+        
+        manifest = {
+            "version": "1.0",
+            "skeleton_standard": "humanoid_mixamo",
+            "animations": {
+                f"sign_{i}": {"file": f"medical/sign_{i}.fbx", "duration": 2.0, "tags": ["medical"]}
+                for i in range(200)
+            }
+        }
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _truncate_manifest(self):
+        with open(self.manifest_path, 'r+b') as f:
+            f.truncate(os.path.getsize(self.manifest_path) // 2)
+    
+    def _check_truncated_manifest_changes_nothing(self):
+        self._truncate_manifest()
+        db = AnimationDatabase(self._tmp.name)
+        
+        self.assertEqual(db.load_from_manifest(self.manifest_path), 0)
+        self.assertEqual(db.animations, {})
+        self.assertEqual(db.get_statistics()["total_animations"], 0)
+        self.assertEqual(db.get_categories(), ())
+    
+    def test_loads_all_entries(self):
+        db = AnimationDatabase(self._tmp.name)
+        
+        self.assertEqual(db.load_from_manifest(self.manifest_path), 200)
+        self.assertEqual(len(db.animations), 200)
+        self.assertEqual(db.get_statistics()["by_category"], {"medical": 200})
+    
+    def test_truncated_manifest_changes_nothing(self):
+        self._check_truncated_manifest_changes_nothing()
+    
+    def test_truncated_manifest_changes_nothing_without_ijson(self):
+        saved = animation_db.ijson
+        animation_db.ijson = None
+        try:
+            self._check_truncated_manifest_changes_nothing()
+        finally:
+            animation_db.ijson = saved
+
+
+if __name__ == '__main__':
+    unittest.main()
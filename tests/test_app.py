@@ -0,0 +1,178 @@
+"""
+Tests for the word → video lookup and the video index cache in app.py
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app
+
+
+VIDEOS = {
+    'main': 'Anatomie/main.mp4',
+    'mal': 'Medical/mal.mp4',
+    'dentiste': 'Medical/dentiste.mp4',
+    'medecin': 'Medical/medecin.mp4',
+    'dos': 'Anatomie/dos.mp4',
+    'cou': 'Anatomie/cou.mp4',
+    'sang': 'Medical/sang.mp4',
+}
+
+
+class PrefixMatchTest(unittest.TestCase):
+    """Prefix fallback for words missing from the video index"""
+    
+    def setUp(self):
+        self._saved = app.video_database, app.video_trie
+        app.video_database = dict(VIDEOS)
+        app.video_trie = app.Trie()
+        for word in VIDEOS:
+            app.video_trie.insert(word)
+        app.match_word_prefix.cache_clear()
+    
+    def tearDown(self):
+        app.video_database, app.video_trie = self._saved
+        app.match_word_prefix.cache_clear()
+    
+    def test_short_suffix_is_accepted(self):
+        # Extra letter / trailing typo on a known word
+        self.assertEqual(app.match_word_prefix('dentistee'), 'dentiste')
+        self.assertEqual(app.match_word_prefix('dose'), 'dos')
+    
+    def test_long_suffix_is_rejected(self):
+        # Different words that merely start with a known key
+        for word in ('maintenant', 'malade', 'medecinxy', 'coude', 'sangle', 'malin'):
+            with self.subTest(word=word):
+                self.assertIsNone(app.match_word_prefix(word))
+    
+    def test_text_to_videos_reports_unmatched_words_as_missing(self):
+        videos, matched, missing, approximate = app.text_to_videos("maintenant je suis malade")
+        
+        self.assertNotIn('Anatomie/main.mp4', videos)
+        self.assertNotIn('Medical/mal.mp4', videos)
+        self.assertIn('maintenant', missing)
+        self.assertIn('malade', missing)
+    
+        self.assertEqual(approximate, [])
+    
+    def test_text_to_videos_flags_prefix_matches_as_approximate(self):
+        videos, matched, missing, approximate = app.text_to_videos("medecin dentistee coude")
+        
+        self.assertEqual(videos, ['Medical/medecin.mp4', 'Medical/dentiste.mp4'])
+        self.assertEqual(matched, ['medecin'])
+        self.assertEqual(missing, ['coude'])
+        self.assertEqual(approximate, [{'word': 'dentistee', 'match': 'dentiste'}])
+
+
+@unittest.skipIf(app.marisa_trie is None, "marisa-trie not installed")
+class PrefixMatchBytesTrieTest(PrefixMatchTest):
+    """Same checks against the frozen marisa-trie index"""
+    
+    def setUp(self):
+        self._saved = app.video_database, app.video_trie
+        app.video_database = app.marisa_trie.BytesTrie(
+            (word, path.encode('utf-8')) for word, path in VIDEOS.items()
+        )
+        app.match_word_prefix.cache_clear()
+
+
+
+class VideoIndexCacheTest(unittest.TestCase):
+    """Reuse and invalidation of VIDEO_INDEX_CACHE"""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.video_dir = os.path.join(self._tmp.name, 'videos')
+        self._add_video('Medical', 'medecin.mp4')
+        
+        self._saved = (app.VIDEO_BASE_PATH, app.VIDEO_INDEX_CACHE,
+                       app.video_database, app.video_trie)
+        app.VIDEO_BASE_PATH = self.video_dir
+        app.VIDEO_INDEX_CACHE = os.path.join(self._tmp.name, 'video_index.pkl')
+    
+    def tearDown(self):
+        (app.VIDEO_BASE_PATH, app.VIDEO_INDEX_CACHE,
+         app.video_database, app.video_trie) = self._saved
+        app.match_word_prefix.cache_clear()
+        self._tmp.cleanup()
+    
+    def _add_video(self, *parts):
+        path = os.path.join(self.video_dir, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, 'wb').close()
+        
+        # Push the parent directory's mtime past anything cached before
+        stat = os.stat(os.path.dirname(path))
+        os.utime(os.path.dirname(path), (stat.st_atime, stat.st_mtime + 10))
+    
+    def _load(self):
+        app.video_database = {}
+        app.video_trie = app.Trie()
+        app.load_video_database()
+    
+    def test_cache_is_written_and_reused(self):
+        self._load()
+        self.assertEqual(app.get_video_path('medecin'), os.path.join('Medical', 'medecin.mp4'))
+        self.assertTrue(os.path.exists(app.VIDEO_INDEX_CACHE))
+        # No temporary file left next to the cache
+        self.assertEqual(sorted(os.listdir(self._tmp.name)), ['video_index.pkl', 'videos'])
+        
+        app.video_database = {}
+        self.assertTrue(app.load_video_index_cache(app.get_video_tree_mtime()))
+        self.assertIn('medecin', app.video_database)
+    
+    def test_scan_reports_the_probed_tree_mtime(self):
+        self._add_video('Medical', 'sub', 'pied.mp4')
+        app.video_database = {}
+        
+        video_count, tree_mtime = app.scan_video_directory()
+        
+        self.assertEqual(video_count, 2)
+        self.assertEqual(tree_mtime, app.get_video_tree_mtime())
+    
+    def test_nested_change_invalidates_cache(self):
+        self._load()
+        self._add_video('Medical', 'sub', 'pied.mp4')
+        self._load()
+        
+        self.assertEqual(app.get_video_path('pied'), os.path.join('Medical', 'sub', 'pied.mp4'))
+    
+    def test_other_version_is_ignored(self):
+        self._load()
+        with open(app.VIDEO_INDEX_CACHE, 'rb') as f:
+            version, base_path, tree_mtime, database = pickle.load(f)
+        with open(app.VIDEO_INDEX_CACHE, 'wb') as f:
+            pickle.dump((version - 1, base_path, tree_mtime, {'stale': 'stale.mp4'}), f)
+        
+        self._load()
+        
+        self.assertIsNone(app.get_video_path('stale'))
+        self.assertIsNotNone(app.get_video_path('medecin'))
+    
+    def test_unreadable_directory_is_skipped(self):
+        self._add_video('Anatomie', 'main.mp4')
+        self._add_video('Prive', 'secret.mp4')
+        unreadable = os.path.join(self.video_dir, 'Prive')
+        
+        real_scandir = os.scandir
+        def scandir(path='.'):
+            if os.fspath(path) == unreadable:
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+        
+        with mock.patch.object(os, 'scandir', scandir):
+            self._load()
+        
+        self.assertIsNotNone(app.get_video_path('medecin'))
+        self.assertIsNotNone(app.get_video_path('main'))
+        self.assertIsNone(app.get_video_path('secret'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for backend.sign_processor
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.sign_processor import SignProcessor
+
+
+class CompoundSignTest(unittest.TestCase):
+    
+    def test_database_keys_keep_compound_underscores(self):
+        processor = SignProcessor({"Salle_de_Attente": "salle_de_attente", "Médecin": "medecin"})
+        
+        self.assertEqual(
+            dict(processor.sign_database),
+            {"salle_de_attente": "salle_de_attente", "medecin": "medecin"}
+        )
+    
+    def test_detected_compound_matches_database_key(self):
+        processor = SignProcessor({"salle_de_attente": "salle_de_attente"})
+        processor.add_compound_sign("salle de attente", "salle_de_attente")
+        
+        words = processor._detect_compound_signs(["la", "salle", "de", "attente"])
+        
+        self.assertEqual(words, ["la", "salle_de_attente"])
+        self.assertIsNotNone(processor._map_word_to_sign(words[1]))
+    
+    def test_token_step_applies_to_process_text(self):
+        class CompoundProcessor(SignProcessor):
+            def tokenize_words(self, words):
+                return self._detect_compound_signs(words)
+        
+        processor = CompoundProcessor({"salle_de_attente": "salle_de_attente", "medecin": "medecin"})
+        processor.add_compound_sign("salle de attente", "salle_de_attente")
+        
+        for text in ("Le medecin, salle de attente", "Le médecin, salle de attente"):
+            result = processor.process_text(text)
+            self.assertEqual(result.get_sign_ids(), ["medecin", "salle_de_attente"])
+            self.assertEqual(result.missing_words, ["le"])
+            self.assertEqual(processor.process_text_ids(text), ["medecin", "salle_de_attente"])
+            self.assertEqual(
+                processor.normalize_and_tokenize(text)[1],
+                processor.tokenize(processor.normalize_text(text))
+            )
+
+
+
+class OverrideHooksTest(unittest.TestCase):
+    """Subclass overrides of the documented hooks are honoured by process_text"""
+    
+    DATABASE = {"le": "le", "medecin": "medecin", "coeur": "coeur"}
+    
+    def _check(self, processor, text, expected_ids):
+        self.assertEqual(processor.process_text(text).get_sign_ids(), expected_ids)
+        self.assertEqual(processor.process_text_ids(text), expected_ids)
+    
+    def test_tokenize_override(self):
+        class NoArticleProcessor(SignProcessor):
+            def tokenize(self, text):
+                return [word for word in super().tokenize(text) if word != "le"]
+        
+        self._check(NoArticleProcessor(self.DATABASE), "Le médecin, le coeur", ["medecin", "coeur"])
+    
+    def test_normalize_text_override(self):
+        class SynonymProcessor(SignProcessor):
+            def normalize_text(self, text):
+                return super().normalize_text(text).replace("docteur", "medecin")
+        
+        processor = SynonymProcessor(self.DATABASE)
+        self._check(processor, "Le docteur", ["le", "medecin"])
+        self.assertEqual(processor.process_text("Le docteur").normalized_text, "le medecin")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+"""
+WSGI entry point for production deployment
+
+Loads the video database synchronously at import, then exposes the Flask app.
+With gunicorn's --preload the index is built once in the master process and
+shared copy-on-write by every worker:
+
+    gunicorn -w 4 -k gthread --threads 4 --preload -b 0.0.0.0:5000 wsgi:app
+
+On Windows, use waitress instead:
+
+    waitress-serve --threads 8 --listen 0.0.0.0:5000 wsgi:app
+"""
+
+import logging
+import os
+
+from app import app, load_video_database
+
+# Re-exported for the WSGI server (wsgi:app)
+__all__ = ['app']
+
+# Log level from the environment (default WARNING keeps request handling quiet)
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'WARNING').upper())
+
+# Load before any worker is forked, so /translate never has to report "loading"
+load_video_database()